@@ -1,12 +1,16 @@
 import requests
 import asyncio
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional
 import uuid
 from datetime import datetime
 import logging
 import os
+import json
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 
 # News API keys
@@ -18,6 +22,23 @@ FINNHUB_API_KEY = "d12jnq1r01qmhi3j2sogd12jnq1r01qmhi3j2sp0"
 # Thread pool for blocking operations
 executor = ThreadPoolExecutor(max_workers=5)
 
+# Upstream request timeout (seconds) so a hung source can't stall a worker thread
+UPSTREAM_TIMEOUT = 10
+
+# Live news stream settings (seconds / queued events per subscriber)
+NEWS_POLL_INTERVAL = 60
+HEARTBEAT_INTERVAL = 15
+SUBSCRIBER_QUEUE_SIZE = 16
+# Backoff for retrying a channel's first fetch (doubles up to NEWS_POLL_INTERVAL)
+NEWS_RETRY_INTERVAL = 5
+# Article URLs remembered per channel when computing deltas
+MAX_SEEN_URLS = 1000
+
+# Channels that may be streamed (the categories/regions offered by NewsSection)
+STREAM_CATEGORIES = {"business", "economy", "markets", "cryptocurrency",
+                     "science", "technology", "astronomy", "space"}
+STREAM_REGIONS = {"us", "in", "eu", "asia"}
+
 # Models
 class NewsArticle(BaseModel):
     title: str
@@ -45,17 +66,7 @@ async def get_news(category: str = "business", region: str = None):
     Regions: us, in, eu, asia, global
     """
     try:
-        # Try primary source first (NewsData.io)
-        articles = await fetch_from_newsdata(category, region)
-        
-        # If primary source fails or returns no results, try fallbacks
-        if not articles:
-            if category.lower() == "cryptocurrency" or category.lower() == "crypto":
-                # Try crypto-specific fallbacks
-                articles = await fetch_crypto_news()
-            else:
-                # Try general fallbacks
-                articles = await fetch_fallback_news(category, region)
+        articles = await fetch_news_articles(category, region)
         
         return NewsResponse(
             category=category,
@@ -66,6 +77,186 @@ async def get_news(category: str = "business", region: str = None):
         logging.error(f"News API error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch news: {str(e)}")
 
+@news_router.get("/stream")
+async def stream_news(request: Request, category: str = "business", region: str = None):
+    """
+    Server-Sent Events stream of news for a (category, region) channel.
+    Sends a `snapshot` event with the current articles, then `articles`
+    events containing only newly published articles. Upstream fetch failures
+    are sent as `news-error` events.
+    """
+    # Validate up front so bad channels get a 400 instead of an empty stream
+    category, region = normalize_news_channel(category, region)
+    
+    async def event_stream():
+        channel = get_news_channel(category, region)
+        queue = channel.subscribe()
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    frame = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": heartbeat\n\n"
+                    continue
+                
+                # None means we fell behind; close so the client reconnects and resyncs
+                if frame is None:
+                    break
+                yield frame
+        finally:
+            channel.unsubscribe(queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+async def fetch_news_articles(category, region=None):
+    """Fetch articles from the primary source, falling back to alternatives"""
+    # Try primary source first (NewsData.io)
+    articles = await fetch_from_newsdata(category, region)
+    
+    # If primary source fails or returns no results, try fallbacks
+    if not articles:
+        if category.lower() == "cryptocurrency" or category.lower() == "crypto":
+            # Try crypto-specific fallbacks
+            articles = await fetch_crypto_news()
+        else:
+            # Try general fallbacks
+            articles = await fetch_fallback_news(category, region)
+    
+    return articles
+
+def format_sse(event, payload):
+    """Encode a payload (e.g. a list of articles) as a single SSE frame"""
+    data = json.dumps(jsonable_encoder(payload))
+    return f"event: {event}\ndata: {data}\n\n"
+
+class NewsChannel:
+    """
+    One upstream polling loop per (category, region), shared by all subscribers.
+    Each subscriber gets a bounded queue; subscribers that fall behind are dropped
+    rather than letting the backlog grow without limit.
+    """
+    
+    def __init__(self, category, region=None):
+        self.category = category
+        self.region = region
+        self.subscribers = set()
+        self.seen_urls = OrderedDict()
+        self.snapshot_frame = None
+        self.error_frame = None
+        self.task = None
+    
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        if self.snapshot_frame is not None:
+            queue.put_nowait(self.snapshot_frame)
+        elif self.error_frame is not None:
+            queue.put_nowait(self.error_frame)
+        self.subscribers.add(queue)
+        if self.task is None:
+            self.task = asyncio.create_task(self._poll())
+        return queue
+    
+    def unsubscribe(self, queue):
+        self.subscribers.discard(queue)
+        self._close_if_idle()
+    
+    def _close_if_idle(self):
+        if self.subscribers:
+            return
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        key = (self.category, self.region)
+        if news_channels.get(key) is self:
+            del news_channels[key]
+    
+    def _publish(self, frame):
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                logging.warning(f"Dropping slow news subscriber on {self.category}/{self.region or 'global'}")
+                self.subscribers.discard(queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+        self._close_if_idle()
+    
+    def _remember(self, articles):
+        # Bounded LRU, so articles that drop out of the upstream list and
+        # come back (or reappear via a fallback source) aren't re-sent
+        for article in articles:
+            self.seen_urls[article.url] = None
+            self.seen_urls.move_to_end(article.url)
+        while len(self.seen_urls) > MAX_SEEN_URLS:
+            self.seen_urls.popitem(last=False)
+    
+    async def _poll(self):
+        retry_interval = NEWS_RETRY_INTERVAL
+        while True:
+            try:
+                articles = await fetch_news_articles(self.category, self.region)
+                
+                if self.snapshot_frame is None:
+                    # First fetch: everyone waiting gets the full list
+                    self._publish(format_sse("snapshot", articles))
+                elif articles:
+                    new_articles = [a for a in articles if a.url not in self.seen_urls]
+                    if new_articles:
+                        self._publish(format_sse("articles", new_articles))
+                
+                if articles or self.snapshot_frame is None:
+                    self.snapshot_frame = format_sse("snapshot", articles)
+                    self._remember(articles)
+                self.error_frame = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"News stream fetch error for {self.category}/{self.region or 'global'}: {str(e)}")
+                self.error_frame = format_sse("news-error", {"detail": f"Failed to fetch news: {str(e)}"})
+                self._publish(self.error_frame)
+                
+                # Nothing to show yet, so retry sooner than the regular poll
+                if self.snapshot_frame is None:
+                    await asyncio.sleep(retry_interval)
+                    retry_interval = min(retry_interval * 2, NEWS_POLL_INTERVAL)
+                    continue
+            
+            await asyncio.sleep(NEWS_POLL_INTERVAL)
+
+# Active channels keyed by (category, region)
+news_channels = {}
+
+def normalize_news_channel(category, region=None):
+    """Map a client category/region onto a known channel key, or raise a 400"""
+    category = (category or "").strip().lower()
+    if category == "crypto":
+        category = "cryptocurrency"
+    region = (region or "").strip().lower()
+    if region in ("", "global"):
+        region = None
+    
+    if category not in STREAM_CATEGORIES:
+        raise HTTPException(status_code=400, detail=f"Unknown news category: {category}")
+    if region is not None and region not in STREAM_REGIONS:
+        raise HTTPException(status_code=400, detail=f"Unknown news region: {region}")
+    return category, region
+
+def get_news_channel(category, region=None):
+    """Return the shared channel for a category/region, creating it if needed"""
+    key = normalize_news_channel(category, region)
+    category, region = key
+    if key not in news_channels:
+        news_channels[key] = NewsChannel(category, region)
+    return news_channels[key]
+
 async def fetch_from_newsdata(category, region=None):
     """Fetch news from NewsData.io API"""
     def _fetch():
@@ -89,7 +280,7 @@ async def fetch_from_newsdata(category, region=None):
             else:
                 url += f"&category={category.lower()}"
         
-        response = requests.get(url)
+        response = requests.get(url, timeout=UPSTREAM_TIMEOUT)
         data = response.json()
         
         if not data.get("results"):
@@ -133,7 +324,7 @@ async def fetch_crypto_from_newsdata():
     """Fetch crypto news from NewsData.io"""
     def _fetch():
         url = f"https://newsdata.io/api/1/news?apikey={NEWSDATA_API_KEY}&language=en&category=cryptocurrency"
-        response = requests.get(url)
+        response = requests.get(url, timeout=UPSTREAM_TIMEOUT)
         data = response.json()
         
         if not data.get("results"):
@@ -159,7 +350,7 @@ async def fetch_crypto_from_gnews():
     """Fetch crypto news from GNews"""
     def _fetch():
         url = f"https://gnews.io/api/v4/search?q=crypto&token={GNEWS_API_KEY}&lang=en"
-        response = requests.get(url)
+        response = requests.get(url, timeout=UPSTREAM_TIMEOUT)
         data = response.json()
         
         if not data.get("articles"):
@@ -185,7 +376,7 @@ async def fetch_crypto_from_finnhub():
     """Fetch crypto news from Finnhub"""
     def _fetch():
         url = f"https://finnhub.io/api/v1/news?category=crypto&token={FINNHUB_API_KEY}"
-        response = requests.get(url)
+        response = requests.get(url, timeout=UPSTREAM_TIMEOUT)
         data = response.json()
         
         if not data:
@@ -1,11 +1,10 @@
 import { useState, useEffect } from 'react';
-import axios from 'axios';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
 function NewsSection({ theme }) {
-  const [newsCategory, setNewsCategory] = useState('business');
+  const [newsCategory, setNewsCategory] = useState(theme === 'finance' ? 'business' : 'science');
   const [newsRegion, setNewsRegion] = useState('global');
   const [newsArticles, setNewsArticles] = useState([]);
   const [loading, setLoading] = useState(false);
@@ -25,6 +24,9 @@ function NewsSection({ theme }) {
     { id: 'in', name: 'India' }
   ];
 
+  // Keep at most this many articles as live updates arrive
+  const MAX_ARTICLES = 100;
+
   useEffect(() => {
     // Set default category based on theme
     if (theme === 'finance') {
@@ -32,32 +34,65 @@ function NewsSection({ theme }) {
     } else {
       setNewsCategory('science');
     }
-    
-    // Load news on theme or category change
-    loadNews();
-  }, [theme, newsCategory, newsRegion]);
+  }, [theme]);
 
-  const loadNews = async () => {
+  useEffect(() => {
+    // Subscribe to the live stream for this category/region
     setLoading(true);
     setError(null);
-    
-    try {
-      const response = await axios.get(`${API}/news`, {
-        params: {
-          category: newsCategory,
-          region: newsRegion !== 'global' ? newsRegion : null
-        }
-      });
-      
-      setNewsArticles(response.data.articles);
-    } catch (err) {
-      console.error('Error loading news:', err);
-      setError('Failed to load news. Please try again later.');
-      setNewsArticles([]);
-    } finally {
-      setLoading(false);
+    setNewsArticles([]);
+
+    const params = new URLSearchParams({ category: newsCategory });
+    if (newsRegion !== 'global') {
+      params.append('region', newsRegion);
     }
-  };
+    const source = new EventSource(`${API}/news/stream?${params}`);
+    let received = false;
+
+    // Full article list, sent on (re)connect
+    source.addEventListener('snapshot', (event) => {
+      received = true;
+      setNewsArticles(JSON.parse(event.data));
+      setError(null);
+      setLoading(false);
+    });
+
+    // Only newly published articles
+    source.addEventListener('articles', (event) => {
+      const newArticles = JSON.parse(event.data);
+      setNewsArticles(prev => {
+        const urls = new Set(newArticles.map(article => article.url));
+        const rest = prev.filter(article => !urls.has(article.url));
+        return [...newArticles, ...rest].slice(0, MAX_ARTICLES);
+      });
+    });
+
+    // Upstream fetch failed on the server; keep any articles already showing
+    source.addEventListener('news-error', (event) => {
+      console.error('Error loading news:', JSON.parse(event.data).detail);
+      if (!received) {
+        setError('Failed to load news. Please try again later.');
+        setLoading(false);
+      }
+    });
+
+    source.onerror = (err) => {
+      // Connection failed or dropped. The browser keeps retrying unless the
+      // stream is closed, and the next snapshot clears the error.
+      if (source.readyState === EventSource.CLOSED) {
+        console.error('Error loading news:', err);
+        setError('Failed to load news. Please try again later.');
+        setNewsArticles([]);
+        setLoading(false);
+      } else if (!received) {
+        console.error('Error connecting to news stream:', err);
+        setError('Failed to load news. Please try again later.');
+        setLoading(false);
+      }
+    };
+
+    return () => source.close();
+  }, [newsCategory, newsRegion]);
 
   const formatDate = (dateString) => {
     if (!dateString) return '';
@@ -0,0 +1,204 @@
+import asyncio
+import json
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+from fastapi import HTTPException
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+import news_api
+from news_api import NewsArticle, NewsChannel, get_news_channel, news_channels, stream_news
+
+
+def make_articles(*urls):
+    return [NewsArticle(title=f"Title {url}", url=url, source="test") for url in urls]
+
+
+def parse_frame(frame):
+    """Split an SSE frame into (event, decoded data)"""
+    lines = frame.strip().split("\n")
+    event = lines[0][len("event: "):]
+    data = json.loads(lines[1][len("data: "):])
+    return event, data
+
+
+class FakeFetcher:
+    """Stand-in for fetch_news_articles returning (or raising) queued results"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    async def __call__(self, category, region=None):
+        self.calls += 1
+        result = self.results[min(self.calls, len(self.results)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class NewsChannelTester(unittest.IsolatedAsyncioTestCase):
+    """Test suite for the shared news stream channels"""
+
+    def setUp(self):
+        patchers = [
+            patch.object(news_api, "NEWS_POLL_INTERVAL", 0.01),
+            patch.object(news_api, "NEWS_RETRY_INTERVAL", 0.01),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        for channel in list(news_channels.values()):
+            if channel.task is not None:
+                channel.task.cancel()
+        news_channels.clear()
+
+    def use_fetcher(self, *results):
+        fetcher = FakeFetcher(*results)
+        patcher = patch.object(news_api, "fetch_news_articles", fetcher)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return fetcher
+
+    async def next_frame(self, queue):
+        return await asyncio.wait_for(queue.get(), timeout=1)
+
+    def test_get_news_channel_normalizes_key(self):
+        """Category case and 'global' region map to the same channel"""
+        channel = get_news_channel("Business", "global")
+        self.assertIs(get_news_channel("business"), channel)
+        self.assertIs(news_channels[("business", None)], channel)
+        self.assertIsNot(get_news_channel("business", "us"), channel)
+
+    def test_get_news_channel_normalizes_region(self):
+        """Region case doesn't create separate channels"""
+        self.assertIs(get_news_channel("business", "US"), get_news_channel("business", "us"))
+        self.assertIs(get_news_channel("crypto"), get_news_channel("cryptocurrency"))
+        self.assertEqual(list(news_channels), [("business", "us"), ("cryptocurrency", None)])
+
+    async def test_unknown_channel_rejected(self):
+        """Unknown categories or regions get a 400 and never start a channel"""
+        for category, region in [("business1", None), ("business", "mars")]:
+            with self.assertRaises(HTTPException) as ctx:
+                get_news_channel(category, region)
+            self.assertEqual(ctx.exception.status_code, 400)
+
+            with self.assertRaises(HTTPException) as ctx:
+                await stream_news(request=None, category=category, region=region)
+            self.assertEqual(ctx.exception.status_code, 400)
+        self.assertEqual(news_channels, {})
+
+    async def test_snapshot_on_subscribe(self):
+        """Subscribers receive the full article list as a snapshot"""
+        self.use_fetcher(make_articles("a", "b"))
+        channel = get_news_channel("business")
+
+        first = channel.subscribe()
+        event, data = parse_frame(await self.next_frame(first))
+        self.assertEqual(event, "snapshot")
+        self.assertEqual([article["url"] for article in data], ["a", "b"])
+
+        # Late joiners get the cached snapshot straight away
+        second = channel.subscribe()
+        self.assertFalse(second.empty())
+        event, data = parse_frame(second.get_nowait())
+        self.assertEqual(event, "snapshot")
+        self.assertEqual([article["url"] for article in data], ["a", "b"])
+
+    async def test_delta_contains_only_new_urls(self):
+        """Later polls publish only articles not seen before"""
+        self.use_fetcher(
+            make_articles("a", "b"),
+            make_articles("c", "a", "b"),
+            # "c" dropped out and came back alongside "d"
+            make_articles("d", "c"),
+        )
+        channel = get_news_channel("business")
+        queue = channel.subscribe()
+
+        event, _ = parse_frame(await self.next_frame(queue))
+        self.assertEqual(event, "snapshot")
+
+        event, data = parse_frame(await self.next_frame(queue))
+        self.assertEqual(event, "articles")
+        self.assertEqual([article["url"] for article in data], ["c"])
+
+        event, data = parse_frame(await self.next_frame(queue))
+        self.assertEqual(event, "articles")
+        self.assertEqual([article["url"] for article in data], ["d"])
+
+    async def test_full_queue_gets_sentinel_and_is_removed(self):
+        """A subscriber that falls behind is dropped with a None sentinel"""
+        channel = NewsChannel("business")
+        slow = asyncio.Queue(maxsize=1)
+        fast = asyncio.Queue(maxsize=10)
+        channel.subscribers.update({slow, fast})
+
+        channel._publish("frame 1")
+        channel._publish("frame 2")
+
+        self.assertNotIn(slow, channel.subscribers)
+        self.assertIn(fast, channel.subscribers)
+        self.assertIsNone(slow.get_nowait())
+        self.assertTrue(slow.empty())
+        self.assertEqual([fast.get_nowait(), fast.get_nowait()], ["frame 1", "frame 2"])
+
+    async def test_last_unsubscribe_closes_channel(self):
+        """The poll task stops and the channel leaves the registry when idle"""
+        self.use_fetcher(make_articles("a"))
+        channel = get_news_channel("business")
+        first = channel.subscribe()
+        second = channel.subscribe()
+        task = channel.task
+        await self.next_frame(first)
+
+        channel.unsubscribe(first)
+        self.assertIs(news_channels[("business", None)], channel)
+        self.assertIs(channel.task, task)
+
+        channel.unsubscribe(second)
+        self.assertNotIn(("business", None), news_channels)
+        self.assertIsNone(channel.task)
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertTrue(task.cancelled())
+
+    async def test_dropping_last_subscriber_cancels_own_task(self):
+        """Dropping the only subscriber from inside the poll loop shuts the channel down"""
+        self.use_fetcher(make_articles("a"), make_articles("b", "a"))
+        channel = get_news_channel("business")
+        with patch.object(news_api, "SUBSCRIBER_QUEUE_SIZE", 1):
+            queue = channel.subscribe()
+        task = channel.task
+
+        # Never read: the snapshot fills the queue, so the delta overflows it
+        with self.assertRaises(asyncio.CancelledError):
+            await asyncio.wait_for(task, timeout=1)
+        self.assertIsNone(queue.get_nowait())
+        self.assertEqual(channel.subscribers, set())
+        self.assertNotIn(("business", None), news_channels)
+
+    async def test_fetch_error_is_published_and_retried(self):
+        """Upstream failures reach subscribers and the first fetch is retried"""
+        fetcher = self.use_fetcher(RuntimeError("upstream down"), make_articles("a"))
+        channel = get_news_channel("business")
+        queue = channel.subscribe()
+
+        event, data = parse_frame(await self.next_frame(queue))
+        self.assertEqual(event, "news-error")
+        self.assertIn("upstream down", data["detail"])
+
+        event, data = parse_frame(await self.next_frame(queue))
+        self.assertEqual(event, "snapshot")
+        self.assertEqual([article["url"] for article in data], ["a"])
+        self.assertEqual(fetcher.calls, 2)
+        self.assertIsNone(channel.error_frame)
+
+
+if __name__ == "__main__":
+    unittest.main()